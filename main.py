@@ -17,6 +17,7 @@ if _SRC_PATH not in sys.path:
     sys.path.insert(0, _SRC_PATH)
 
 from telebio.config import load_settings, Settings
+from telebio.modes import ModeRef
 from telebio.prompts import Prompt, get_prompt, load_prompts
 from telebio.providers.base import BioProvider
 from telebio.providers.list_provider import ListBioProvider
@@ -142,6 +143,28 @@ def _configure_logging(level: str) -> None:
 # Main
 # ------------------------------------------------------------------
 
+async def _wait_for_shutdown(
+    stop_event: asyncio.Event, scheduler_task: asyncio.Task[None]
+) -> None:
+    """Block until a stop signal arrives or the scheduler exits on its own.
+
+    Whichever happens first, the other side is cancelled, so a crashed
+    scheduler shuts the app down instead of leaving it hanging on the signal.
+    """
+    stop_task = asyncio.create_task(stop_event.wait())
+    done, pending = await asyncio.wait(
+        {scheduler_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+    )
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    if scheduler_task in done and not scheduler_task.cancelled():
+        exc = scheduler_task.exception()
+        if exc is not None:
+            logger.error("Scheduler crashed — shutting down", exc_info=exc)
+
+
 async def _async_main() -> None:
     settings = load_settings()
     _configure_logging(settings.log_level)
@@ -171,12 +194,12 @@ async def _async_main() -> None:
     ) as tg:
         # Shared mutable runtime state (mode + active prompt) — read by both the
         # scheduler and the management bot.
-        state = {"mode": initial_mode, "prompt_name": initial_prompt}
+        mode_ref = ModeRef(mode=initial_mode, prompt_name=initial_prompt)
 
         # Provider factory for (re)building on mode / prompt change
         def provider_factory(mode: str) -> BioProvider:
             return _build_provider_by_mode(
-                mode, settings, tg, prompts, state.get("prompt_name")
+                mode, settings, tg, prompts, mode_ref.prompt_name
             )
 
         provider = provider_factory(initial_mode)
@@ -184,18 +207,18 @@ async def _async_main() -> None:
         # Start management bot if token is provided
         bot = None
         if settings.bot_token:
-            me = await tg._client.get_me()
             bot = BotService(
                 bot_token=settings.bot_token,
                 api_id=settings.api_id,
                 api_hash=settings.api_hash,
-                current_mode=state,
+                mode_ref=mode_ref,
                 telegram=tg,
                 provider_factory=provider_factory,
                 prompts=prompts,
                 store=store,
             )
-            await bot.start(owner_id=me.id)
+            # The user is already resolved by tg.start(); no second get_me().
+            await bot.start(owner_id=tg.me_id)
             logger.info("Management bot enabled")
 
         # Graceful shutdown on SIGINT / SIGTERM
@@ -215,20 +238,13 @@ async def _async_main() -> None:
                 provider,
                 scheduler_interval,
                 provider_factory=provider_factory,
-                current_mode=state,
+                mode_ref=mode_ref,
                 bot=bot,
             )
         )
 
-        # Wait until a stop signal arrives, then cancel the scheduler
-        await stop_event.wait()
-        scheduler_task.cancel()
+        await _wait_for_shutdown(stop_event, scheduler_task)
 
-        try:
-            await scheduler_task
-        except asyncio.CancelledError:
-            pass
-        
         # Stop bot if running
         if bot:
             await bot.stop()
@@ -239,7 +255,12 @@ async def _async_main() -> None:
 
 def main() -> None:
     """Synchronous wrapper for the async entry point."""
-    asyncio.run(_async_main())
+    try:
+        import uvloop
+    except ImportError:  # not available on Windows — stdlib loop it is
+        asyncio.run(_async_main())
+    else:
+        uvloop.run(_async_main())
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import logging
 from dataclasses import dataclass, field
@@ -15,7 +16,11 @@ logger = logging.getLogger(__name__)
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 _ENV_PATH = _PROJECT_ROOT / ".env"
 
-load_dotenv(_ENV_PATH)
+
+@functools.cache
+def _load_env_once() -> None:
+    """Parse .env into os.environ on first use; later calls are no-ops."""
+    load_dotenv(_ENV_PATH)
 
 
 def _get_env(key: str, *, default: str | None = None, required: bool = False) -> str:
@@ -138,6 +143,7 @@ class Settings:
 
 def load_settings() -> Settings:
     """Build Settings from environment variables."""
+    _load_env_once()
     return Settings(
         api_id=int(_get_env("TELEGRAM_API_ID", required=True)),
         api_hash=_get_env("TELEGRAM_API_HASH", required=True),
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 MODE_LIST = "list"
 MODE_LLM = "llm_prompt_generation"
 MODE_TELEGRAM_CONTEXT = "telegram_context"
 
 # Stable order used for menus and onboarding.
 MODES: tuple[str, ...] = (MODE_LIST, MODE_LLM, MODE_TELEGRAM_CONTEXT)
+_VALID_MODES: frozenset[str] = frozenset(MODES)
 
 # Friendly Russian labels shown on buttons (technical key kept alongside).
 MODE_LABELS: dict[str, str] = {
@@ -24,8 +27,16 @@ MODE_DESCRIPTIONS: dict[str, str] = {
 }
 
 
+@dataclass(slots=True)
+class ModeRef:
+    """Active mode and prompt, shared by reference between the scheduler and the bot."""
+
+    mode: str
+    prompt_name: str | None = None
+
+
 def is_valid(mode: str) -> bool:
-    return mode in MODE_LABELS
+    return mode in _VALID_MODES
 
 
 def display(mode: str) -> str:
@@ -6,8 +6,11 @@ This keeps the rest of the application decoupled from the data source.
 
 from __future__ import annotations
 
+import logging
 from typing import Protocol, runtime_checkable
 
+logger = logging.getLogger(__name__)
+
 
 @runtime_checkable
 class BioProvider(Protocol):
@@ -16,3 +19,19 @@ class BioProvider(Protocol):
     async def get_bio(self) -> str:
         """Return the next bio string (max 70 chars for Telegram)."""
         ...
+
+
+@runtime_checkable
+class ClosableProvider(Protocol):
+    """Provider that holds resources (e.g. a pooled HTTP client)."""
+
+    async def aclose(self) -> None: ...
+
+
+async def close_provider(provider: BioProvider) -> None:
+    """Release *provider*'s resources if it has any; never raises."""
+    if isinstance(provider, ClosableProvider):
+        try:
+            await provider.aclose()
+        except Exception:
+            logger.exception("Failed to close provider %r", provider)
@@ -8,21 +8,30 @@ Selection strategy: sequential with wrap-around.
 
 from __future__ import annotations
 
-import json
+import itertools
 import logging
+import mmap
+import sys
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 _TELEGRAM_BIO_MAX_LENGTH = 70
 
+# Validated phrase tuples keyed by path. The provider is rebuilt on every /new
+# and mode switch, so the file is only re-parsed when its mtime/size change.
+_PHRASES_CACHE: dict[Path, tuple[tuple[int, int], tuple[str, ...]]] = {}
+
 
 class ListBioProvider:
     """Reads phrases from a JSON file and yields them sequentially."""
 
     def __init__(self, phrases_path: Path) -> None:
         self._phrases = self._load(phrases_path)
-        self._index = 0
+        # _load guarantees a non-empty tuple, so the cycle never runs dry.
+        self._cycle = itertools.cycle(self._phrases)
         logger.info("Loaded %d phrases from %s", len(self._phrases), phrases_path)
 
     # ------------------------------------------------------------------
@@ -31,40 +40,62 @@ class ListBioProvider:
 
     async def get_bio(self) -> str:
         """Return the next phrase, cycling through the list."""
-        if not self._phrases:
-            raise RuntimeError("Phrase list is empty — nothing to set as bio.")
-
-        phrase = self._phrases[self._index]
-        self._index = (self._index + 1) % len(self._phrases)
-        return phrase
+        return next(self._cycle)
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _load(path: Path) -> list[str]:
+    def _load(path: Path) -> tuple[str, ...]:
         if not path.exists():
             raise FileNotFoundError(f"Phrases file not found: {path}")
 
-        with path.open(encoding="utf-8") as fh:
-            data = json.load(fh)
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _PHRASES_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # mmap refuses empty files; an empty file is just invalid content.
+        data = _loads_mapped(path) if stat.st_size else None
 
         if not isinstance(data, list) or not all(isinstance(s, str) for s in data):
             raise ValueError(f"Expected a JSON array of strings in {path}")
 
-        valid: list[str] = []
-        for phrase in data:
-            if len(phrase) > _TELEGRAM_BIO_MAX_LENGTH:
-                logger.warning(
-                    "Phrase truncated to %d chars: '%s…'",
-                    _TELEGRAM_BIO_MAX_LENGTH,
-                    phrase[:30],
-                )
-                phrase = phrase[:_TELEGRAM_BIO_MAX_LENGTH]
-            valid.append(phrase)
-
-        if not valid:
+        if not data:
             raise ValueError("Phrases file is empty.")
 
-        return valid
+        # Common case: nothing to truncate, so skip the per-phrase branch.
+        if max(map(len, data)) > _TELEGRAM_BIO_MAX_LENGTH:
+            data = [_truncate(phrase) for phrase in data]
+
+        # Duplicate phrases collapse into one shared object.
+        phrases = tuple(map(sys.intern, data))
+        _PHRASES_CACHE[path] = (signature, phrases)
+        return phrases
+
+
+def _truncate(phrase: str) -> str:
+    if len(phrase) <= _TELEGRAM_BIO_MAX_LENGTH:
+        return phrase
+    logger.warning(
+        "Phrase truncated to %d chars: '%s…'",
+        _TELEGRAM_BIO_MAX_LENGTH,
+        phrase[:30],
+    )
+    return phrase[:_TELEGRAM_BIO_MAX_LENGTH]
+
+
+def _loads_mapped(path: Path) -> object:
+    """Parse JSON straight from a read-only mapping of *path*.
+
+    orjson copies every string out of the buffer, so nothing references the
+    mapping once it is closed, and the file is never duplicated into a bytes.
+    """
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as buf,
+    ):
+        return orjson.loads(buf)
@@ -8,12 +8,12 @@ Examples for few-shot prompting are loaded from a separate JSON file.
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +43,10 @@ _SYSTEM_PROMPT = (
 
 _YANDEX_API_URL = "https://llm.api.cloud.yandex.net/foundationModels/v1/completion"
 _DEFAULT_TIMEOUT = 30  # seconds
+# One request per scheduler tick: a single kept-alive connection is plenty.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=1, max_keepalive_connections=1, keepalive_expiry=300
+)
 
 
 class LLMBioProvider:
@@ -57,18 +61,35 @@ class LLMBioProvider:
         model: str = "yandexgpt-lite/latest",
         temperature: float = 0.9,
         system_prompt: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
-        self._api_key = api_key
-        self._folder_id = folder_id
+        self._headers = httpx.Headers({
+            "Authorization": f"Api-Key {api_key}",
+            "x-folder-id": folder_id,
+            "content-type": "application/json",
+        })
         self._model_uri = f"gpt://{folder_id}/{model}"
-        self._temperature = temperature
-        self._system_prompt = system_prompt or _SYSTEM_PROMPT
-        self._examples = self._load_examples(examples_path)
+        examples = self._load_examples(examples_path)
+        # Everything in the request is fixed after init: serialise it once and
+        # keep only the bytes, not the examples it was built from.
+        self._payload = orjson.dumps(
+            self._build_request_body(
+                model_uri=self._model_uri,
+                temperature=temperature,
+                system_prompt=system_prompt or _SYSTEM_PROMPT,
+                examples=examples,
+            )
+        )
+        # Created on first request and kept open so subsequent calls reuse the
+        # pooled TLS connection; released via aclose().
+        self._client: httpx.AsyncClient | None = None
+        # None means httpx's default network transport; tests pass a mock.
+        self._transport = transport
 
         logger.info(
             "LLMBioProvider initialised (model=%s, examples=%d)",
             self._model_uri,
-            len(self._examples),
+            len(examples),
         )
 
     # ------------------------------------------------------------------
@@ -77,36 +98,47 @@ class LLMBioProvider:
 
     async def get_bio(self) -> str:
         """Call YandexGPT and return a generated bio string."""
-        body = self._build_request_body()
-
-        async with httpx.AsyncClient(timeout=_DEFAULT_TIMEOUT) as client:
-            response = await client.post(
-                _YANDEX_API_URL,
-                json=body,
-                headers={
-                    "Authorization": f"Api-Key {self._api_key}",
-                    "x-folder-id": self._folder_id,
-                },
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=_DEFAULT_TIMEOUT,
+                headers=self._headers,
+                limits=_POOL_LIMITS,
+                transport=self._transport,
             )
-            response.raise_for_status()
-            data = response.json()
+
+        response = await self._client.post(_YANDEX_API_URL, content=self._payload)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         text = self._extract_text(data)
         logger.info("YandexGPT generated bio: '%s'", text)
         return text
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     # ------------------------------------------------------------------
     # Request building
     # ------------------------------------------------------------------
 
-    def _build_request_body(self) -> dict[str, Any]:
+    @staticmethod
+    def _build_request_body(
+        *,
+        model_uri: str,
+        temperature: float,
+        system_prompt: str,
+        examples: tuple[str, ...],
+    ) -> dict[str, Any]:
         """Construct the JSON payload with system prompt + few-shot examples."""
         messages: list[dict[str, str]] = [
-            {"role": "system", "text": self._system_prompt},
+            {"role": "system", "text": system_prompt},
         ]
 
         # Few-shot: each example is presented as a user request → assistant response pair
-        for example in self._examples:
+        for example in examples:
             messages.append({"role": "user", "text": "Придумай фразу для био."})
             messages.append({"role": "assistant", "text": example})
 
@@ -114,10 +146,10 @@ class LLMBioProvider:
         messages.append({"role": "user", "text": "Придумай фразу для био."})
 
         return {
-            "modelUri": self._model_uri,
+            "modelUri": model_uri,
             "completionOptions": {
                 "stream": False,
-                "temperature": self._temperature,
+                "temperature": temperature,
                 "maxTokens": 100,
             },
             "messages": messages,
@@ -165,17 +197,18 @@ class LLMBioProvider:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _load_examples(path: Path) -> list[str]:
+    def _load_examples(path: Path) -> tuple[str, ...]:
         """Load few-shot examples from a JSON file (array of strings)."""
         if not path.exists():
             logger.warning("Examples file not found: %s — proceeding without examples", path)
-            return []
+            return ()
 
-        with path.open(encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = orjson.loads(path.read_bytes())
 
-        if not isinstance(data, list) or not all(isinstance(s, str) for s in data):
+        # orjson only ever produces exact str, so an identity check is enough
+        # and skips isinstance's MRO walk.
+        if type(data) is not list or not all(type(s) is str for s in data):
             raise ValueError(f"Expected a JSON array of strings in {path}")
 
         logger.info("Loaded %d few-shot examples from %s", len(data), path)
-        return data
+        return tuple(data)
@@ -11,10 +11,10 @@ from typing import TYPE_CHECKING
 
 from telebio.context_exceptions import ContextBatchNotReady
 from telebio.modes import (
-    MODE_LIST,
     MODE_TELEGRAM_CONTEXT,
     is_valid,
 )
+from telebio.providers.base import close_provider
 from telebio.services import texts
 
 if TYPE_CHECKING:
@@ -26,21 +26,18 @@ logger = logging.getLogger(__name__)
 def menu_text(bot: BotService) -> str:
     """Header text for the main menu."""
     return texts.menu_text(
-        mode=bot.current_mode.get("mode", "unknown"),
+        mode=bot.mode,
         bio=bot.last_bio,
         prompt_name=bot.prompt_name,
     )
 
 
 def status_text(bot: BotService) -> str:
-    last_update = (
-        bot.last_update.strftime("%Y-%m-%d %H:%M:%S") if bot.last_update else None
-    )
     return texts.status_text(
-        mode=bot.current_mode.get("mode", "unknown"),
+        mode=bot.mode,
         paused=bot.paused,
         bio=bot.last_bio,
-        last_update=last_update,
+        last_update=bot.last_update_str,
     )
 
 
@@ -59,10 +56,13 @@ def toggle_pause_text(bot: BotService) -> str:
 
 def apply_mode(bot: BotService, mode: str) -> str:
     """Switch the active bio-provider mode."""
-    mode = mode.strip().lower()
+    # Buttons and typical commands already carry the canonical key, so only
+    # normalise (and allocate a new string) when the raw value doesn't match.
     if not is_valid(mode):
-        return texts.MODE_UNKNOWN
-    if mode == bot.current_mode.get("mode", ""):
+        mode = mode.strip().lower()
+        if not is_valid(mode):
+            return texts.MODE_UNKNOWN
+    if mode == bot.mode:
         return texts.mode_already(mode)
     bot.set_mode(mode)
     logger.info("Mode switched to '%s'", mode)
@@ -81,7 +81,17 @@ async def run_new(bot: BotService) -> str:
     if not bot.telegram or not bot.provider_factory:
         return texts.NEW_NOT_CONFIGURED
 
-    mode = bot.current_mode.get("mode", MODE_LIST)
+    # A repeated /new while one is running would just burn another provider
+    # call (an LLM request for most modes); tell the owner to wait instead.
+    if bot.new_lock.locked():
+        return texts.NEW_IN_PROGRESS
+    async with bot.new_lock:
+        return await _apply_new_bio(bot)
+
+
+async def _apply_new_bio(bot: BotService) -> str:
+    mode = bot.mode
+    provider = None
     try:
         provider = bot.provider_factory(mode)
         if mode == MODE_TELEGRAM_CONTEXT:
@@ -101,6 +111,9 @@ async def run_new(bot: BotService) -> str:
     except Exception:
         logger.exception("Error during /new")
         return texts.NEW_ERROR
+    finally:
+        if provider is not None:
+            await close_provider(provider)
 
 
 async def run_collect(bot: BotService) -> str:
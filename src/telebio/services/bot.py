@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections import deque
+import time
 from collections.abc import Callable
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from telethon import TelegramClient
+from telethon.network import ConnectionTcpAbridged
 
 from telebio.services.handlers import register_all
 
 if TYPE_CHECKING:
+    from telebio.modes import ModeRef
     from telebio.prompts import Prompt
     from telebio.providers.base import BioProvider
     from telebio.services.state_store import StateStore
@@ -20,6 +23,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# /history shows the most recent updates only; older ones stay in the store.
+_HISTORY_SIZE = 10
+_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class HistoryEntry(NamedTuple):
+    """One recorded bio update as shown by /history."""
+
+    bio: str
+    mode: str
+    timestamp: str
+
 
 class BotService:
     """Manages a Telegram bot for controlling the telebio application."""
@@ -29,7 +44,7 @@ class BotService:
         bot_token: str,
         api_id: int,
         api_hash: str,
-        current_mode: dict[str, str],
+        mode_ref: ModeRef,
         telegram: TelegramService | None = None,
         provider_factory: Callable[[str], BioProvider] | None = None,
         prompts: list[Prompt] | None = None,
@@ -41,23 +56,38 @@ class BotService:
             bot_token: Telegram bot token from @BotFather
             api_id: Telegram API ID
             api_hash: Telegram API hash
-            current_mode: Dict reference to track current mode and active prompt
+            mode_ref: Shared reference to the current mode and active prompt
             telegram: Telegram service for updating bio
             provider_factory: Factory to build a provider by mode name
             prompts: Named prompts available for llm_prompt_generation
             store: Optional SQLite-backed persistence for state and history
         """
-        self._bot = TelegramClient("bot_session", api_id, api_hash)
+        self._bot = TelegramClient(
+            "bot_session", api_id, api_hash, connection=ConnectionTcpAbridged
+        )
         self._token = bot_token
-        self._current_mode = current_mode
+        self._mode_ref = mode_ref
         self._telegram = telegram
         self._provider_factory = provider_factory
         self._prompts: list[Prompt] = prompts or []
-        self._history: deque[dict] = deque()
+        # Fixed-size ring buffer, one column per field; timestamps are stored
+        # already formatted, so /history never calls strftime.
+        self._hist_bio: list[str | None] = [None] * _HISTORY_SIZE
+        self._hist_mode: list[str | None] = [None] * _HISTORY_SIZE
+        self._hist_ts: list[str | None] = [None] * _HISTORY_SIZE
+        self._hist_idx = 0
+        self._hist_count = 0
         self._last_bio: str = ""
         self._last_update: datetime | None = None
+        # Formatted once per update; /status just reads it.
+        self._last_update_str: str | None = None
         self._owner_id: int | None = None
         self._paused: bool = False
+        # Set on mode / prompt / pause changes so the scheduler wakes up early
+        # instead of sleeping out the full interval.
+        self._changed = asyncio.Event()
+        # Held while /new (command or button) is generating a bio.
+        self._new_lock = asyncio.Lock()
         self._store = store
         if store is not None:
             self._restore_from_store(store)
@@ -65,28 +95,39 @@ class BotService:
     def _restore_from_store(self, store: StateStore) -> None:
         settings = store.load_settings()
         if "mode" in settings:
-            self._current_mode["mode"] = settings["mode"]
+            self._mode_ref.mode = settings["mode"]
         if "prompt_name" in settings:
-            self._current_mode["prompt_name"] = settings["prompt_name"]
+            self._mode_ref.prompt_name = settings["prompt_name"]
         self._paused = settings.get("paused", "0") == "1"
         self._last_bio = settings.get("last_bio", "")
         last_update_str = settings.get("last_update")
         if last_update_str:
             try:
-                self._last_update = datetime.strptime(
-                    last_update_str, "%Y-%m-%d %H:%M:%S"
-                )
+                self._last_update = datetime.strptime(last_update_str, _TS_FORMAT)
+                self._last_update_str = last_update_str
             except ValueError:
                 logger.warning("Bad last_update in store: %r", last_update_str)
-        self._history.extend(store.load_history())
+        # History only ever displays the timestamp, so the stored string is
+        # pushed as-is — no parsing, and no rows dropped over its format.
+        for row in store.load_history(limit=_HISTORY_SIZE):
+            self._push_history(row["bio"], row["mode"], row["timestamp"])
+
+    def _push_history(self, bio: str, mode: str, ts: str) -> None:
+        idx = self._hist_idx
+        self._hist_bio[idx] = bio
+        self._hist_mode[idx] = mode
+        self._hist_ts[idx] = ts
+        self._hist_idx = (idx + 1) % _HISTORY_SIZE
+        if self._hist_count < _HISTORY_SIZE:
+            self._hist_count += 1
 
     # ------------------------------------------------------------------
     # Public read-only properties used by handlers
     # ------------------------------------------------------------------
 
     @property
-    def current_mode(self) -> dict[str, str]:
-        return self._current_mode
+    def mode(self) -> str:
+        return self._mode_ref.mode
 
     @property
     def telegram(self) -> TelegramService | None:
@@ -102,7 +143,7 @@ class BotService:
 
     @property
     def prompt_name(self) -> str | None:
-        return self._current_mode.get("prompt_name")
+        return self._mode_ref.prompt_name
 
     @property
     def last_bio(self) -> str:
@@ -113,8 +154,24 @@ class BotService:
         return self._last_update
 
     @property
-    def history(self) -> deque[dict]:
-        return self._history
+    def last_update_str(self) -> str | None:
+        """``last_update`` as ``YYYY-MM-DD HH:MM:SS``, or ``None`` if never updated."""
+        return self._last_update_str
+
+    @property
+    def history(self) -> list[HistoryEntry]:
+        """Recent updates, newest first (at most ``_HISTORY_SIZE``)."""
+        entries: list[HistoryEntry] = []
+        for offset in range(1, self._hist_count + 1):
+            idx = (self._hist_idx - offset) % _HISTORY_SIZE
+            entries.append(HistoryEntry(
+                self._hist_bio[idx], self._hist_mode[idx], self._hist_ts[idx]
+            ))
+        return entries
+
+    @property
+    def new_lock(self) -> asyncio.Lock:
+        return self._new_lock
 
     @property
     def paused(self) -> bool:
@@ -148,38 +205,48 @@ class BotService:
     def record_bio_update(self, bio: str, mode: str) -> None:
         """Record a bio update for history tracking."""
         self._last_bio = bio
-        self._last_update = datetime.now()
-        self._history.append({
-            "bio": bio,
-            "mode": mode,
-            "timestamp": self._last_update.strftime("%Y-%m-%d %H:%M:%S"),
-        })
+        # One clock read; format via time.strftime directly rather than
+        # datetime.strftime, which builds a timetuple and calls it anyway.
+        now = time.time()
+        self._last_update = datetime.fromtimestamp(now)
+        ts = self._last_update_str = time.strftime(_TS_FORMAT, time.localtime(now))
+        self._push_history(bio, mode, ts)
         if self._store is not None:
             self._store.append_bio(bio=bio, mode=mode, ts=self._last_update)
             self._store.save_setting("last_bio", bio)
-            self._store.save_setting(
-                "last_update", self._last_update.strftime("%Y-%m-%d %H:%M:%S")
-            )
-        logger.debug("Recorded bio update: %s", bio)
+            self._store.save_setting("last_update", ts)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recorded bio update: %s", bio)
 
     def toggle_pause(self) -> None:
         """Flip the paused flag."""
         self._paused = not self._paused
+        self._changed.set()
         if self._store is not None:
             self._store.save_setting("paused", "1" if self._paused else "0")
 
     def set_prompt(self, name: str) -> None:
         """Set the active named prompt for llm_prompt_generation."""
-        self._current_mode["prompt_name"] = name
+        self._mode_ref.prompt_name = name
+        self._changed.set()
         if self._store is not None:
             self._store.save_setting("prompt_name", name)
 
     def set_mode(self, mode: str) -> None:
         """Switch the active bio-provider mode and persist it."""
-        self._current_mode["mode"] = mode
+        self._mode_ref.mode = mode
+        self._changed.set()
         if self._store is not None:
             self._store.save_setting("mode", mode)
 
+    async def wait_for_change(self, timeout: float) -> None:
+        """Sleep up to *timeout* seconds, returning early on a state change."""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._changed.clear()
+
     # ------------------------------------------------------------------
     # Context manager
     # ------------------------------------------------------------------
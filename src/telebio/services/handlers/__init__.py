@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import TYPE_CHECKING
 
 from telethon import events
@@ -20,42 +23,54 @@ if TYPE_CHECKING:
     from telethon import TelegramClient
     from telebio.services.bot import BotService
 
+# Exact-token command table; one dict lookup replaces a regex per command.
+_COMMANDS: dict[str, Callable[..., Awaitable[None]]] = {
+    "/start": handle_start,
+    "/menu": handle_menu,
+    "/status": handle_status,
+    "/history": handle_history,
+    "/set_mode": handle_set_mode,
+    "/new": handle_new,
+    "/collect": handle_collect,
+    "/pause": handle_pause,
+}
+# /set_mode is the only command with an argument; handle_set_mode reads it
+# from event.pattern_match, as it would with a pattern-filtered handler.
+# Anchored at both ends: unlike the other commands, "/set_mode list extra" is
+# rejected rather than switching to "list".
+_PAT_SET_MODE = re.compile(r"^/set_mode(?:@\w+)? (\w+)$", re.ASCII)
+
+
+async def dispatch_command(event: events.NewMessage.Event, bot: BotService) -> None:
+    """Route an owner message to its command handler, ignoring anything else.
+
+    The first token picks the handler; an optional ``@botname`` suffix is
+    accepted. Argument-less commands ignore any trailing text, so deep links
+    like ``/start <payload>`` still reach their handler.
+    """
+    text = event.raw_text
+    token = text.partition(" ")[0]
+    handler = _COMMANDS.get(token.partition("@")[0])
+    if handler is None:
+        return
+    if handler is handle_set_mode:
+        event.pattern_match = _PAT_SET_MODE.match(text)
+        if event.pattern_match is None:
+            return
+    await handler(event, bot)
+
 
 def register_all(client: TelegramClient, bot: BotService, owner_id: int) -> None:
-    """Register every command and callback handler on *client*."""
-    client.add_event_handler(
-        lambda e: handle_start(e, bot),
-        events.NewMessage(pattern="/start", from_users=owner_id),
-    )
-    client.add_event_handler(
-        lambda e: handle_menu(e, bot),
-        events.NewMessage(pattern="/menu", from_users=owner_id),
-    )
-    client.add_event_handler(
-        lambda e: handle_status(e, bot),
-        events.NewMessage(pattern="/status", from_users=owner_id),
-    )
-    client.add_event_handler(
-        lambda e: handle_history(e, bot),
-        events.NewMessage(pattern="/history", from_users=owner_id),
-    )
-    client.add_event_handler(
-        lambda e: handle_set_mode(e, bot),
-        events.NewMessage(pattern=r"/set_mode (\w+)", from_users=owner_id),
-    )
-    client.add_event_handler(
-        lambda e: handle_new(e, bot),
-        events.NewMessage(pattern="/new", from_users=owner_id),
-    )
-    client.add_event_handler(
-        lambda e: handle_collect(e, bot),
-        events.NewMessage(pattern="/collect", from_users=owner_id),
-    )
+    """Register the command dispatcher and the callback handler on *client*.
+
+    Handlers are bound with ``partial`` rather than a lambda, so Telethon calls
+    them without an extra Python frame per update.
+    """
     client.add_event_handler(
-        lambda e: handle_pause(e, bot),
-        events.NewMessage(pattern="/pause", from_users=owner_id),
+        partial(dispatch_command, bot=bot),
+        events.NewMessage(from_users=owner_id),
     )
     client.add_event_handler(
-        lambda e: handle_callback(e, bot),
+        partial(handle_callback, bot=bot),
         events.CallbackQuery(func=lambda e: e.sender_id == owner_id),
     )
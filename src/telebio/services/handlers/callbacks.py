@@ -36,13 +36,13 @@ async def handle_callback(event: events.CallbackQuery.Event, bot: BotService) ->
     if data == "menu:main":
         await _safe_edit(event, actions.menu_text(bot), main_menu(bot))
     elif data == "menu:modes":
-        await _safe_edit(event, texts.MODE_MENU, mode_menu(bot.current_mode.get("mode", "")))
+        await _safe_edit(event, texts.MODE_MENU, mode_menu(bot.mode))
     elif data == "menu:prompts":
         await _safe_edit(event, _prompts_header(bot), prompts_menu(bot.prompts, bot.prompt_name))
     elif data.startswith("mode:"):
         result = actions.apply_mode(bot, data.split(":", 1)[1])
         await event.answer(_toast(result))
-        if bot.current_mode.get("mode") == MODE_LLM:
+        if bot.mode == MODE_LLM:
             await _safe_edit(event, _prompts_header(bot), prompts_menu(bot.prompts, bot.prompt_name))
         else:
             await _safe_edit(event, actions.menu_text(bot), main_menu(bot))
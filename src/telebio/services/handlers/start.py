@@ -20,7 +20,6 @@ __all__ = ["handle_start", "onboarding_text"]
 
 async def handle_start(event: events.NewMessage.Event, bot: BotService) -> None:
     """Greet the owner and offer the mode picker."""
-    current = bot.current_mode.get("mode", "")
     await event.respond(
-        onboarding_text(), parse_mode="html", buttons=mode_menu(current)
+        onboarding_text(), parse_mode="html", buttons=mode_menu(bot.mode)
     )
@@ -21,7 +21,7 @@ if TYPE_CHECKING:
 
 
 def main_menu(bot: BotService) -> list[list[Button]]:
-    mode = bot.current_mode.get("mode", "")
+    mode = bot.mode
     rows: list[list[Button]] = [
         [Button.inline("✨ Новое био", b"act:new")],
         [
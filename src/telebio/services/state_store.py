@@ -71,10 +71,19 @@ class StateStore:
             (ts.strftime("%Y-%m-%d %H:%M:%S"), bio, mode),
         )
 
-    def load_history(self) -> list[dict[str, Any]]:
-        cur = self._conn.execute(
-            "SELECT ts, bio, mode FROM bio_history ORDER BY id ASC"
-        )
+    def load_history(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return history oldest-first; with *limit*, only the newest rows."""
+        if limit is None:
+            cur = self._conn.execute(
+                "SELECT ts, bio, mode FROM bio_history ORDER BY id ASC"
+            )
+        else:
+            cur = self._conn.execute(
+                "SELECT ts, bio, mode FROM ("
+                "SELECT id, ts, bio, mode FROM bio_history ORDER BY id DESC LIMIT ?"
+                ") ORDER BY id ASC",
+                (limit,),
+            )
         return [
             {"timestamp": ts, "bio": bio, "mode": mode}
             for ts, bio, mode in cur.fetchall()
@@ -9,6 +9,7 @@ from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 from telethon import TelegramClient, errors, functions
+from telethon.network import ConnectionTcpAbridged
 from telethon.tl.types import Message
 
 if TYPE_CHECKING:
@@ -24,12 +25,28 @@ class _TimelineEvent:
 
 logger = logging.getLogger(__name__)
 
+# update_bio gives up after this many flood-waits, or straight away when
+# Telegram asks for a longer pause than we are willing to block the caller.
+_FLOOD_WAIT_ATTEMPTS = 3
+_FLOOD_WAIT_MAX_SECONDS = 300
+
 
 class TelegramService:
     """Manages a Telethon user-bot session and exposes high-level helpers."""
 
     def __init__(self, api_id: int, api_hash: str, session_path: str) -> None:
-        self._client = TelegramClient(session_path, api_id, api_hash)
+        # Abridged framing: 1-byte length prefix for small packets instead of
+        # TcpFull's length + seqno + CRC32 — our RPCs are all tiny.
+        self._client = TelegramClient(
+            session_path, api_id, api_hash, connection=ConnectionTcpAbridged
+        )
+        self._me_id: int | None = None
+        # Serialises bio updates from the scheduler and /new. Each call takes a
+        # ticket; a waiter whose ticket is no longer the newest was superseded
+        # and skips its RPC, so a burst costs at most one in-flight call plus
+        # the latest one.
+        self._bio_lock = asyncio.Lock()
+        self._bio_ticket = 0
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -37,11 +54,18 @@ class TelegramService:
 
     async def start(self) -> None:
         """Start the client and ensure the user is authorised."""
+        _warn_if_no_cryptg()
         logger.info("Connecting to Telegram…")
         await self._client.start()
         me = await self._client.get_me()
+        self._me_id = me.id
         logger.info("Signed in as %s (id=%s)", me.first_name, me.id)
 
+    @property
+    def me_id(self) -> int | None:
+        """Telegram id of the signed-in user, known after :meth:`start`."""
+        return self._me_id
+
     async def stop(self) -> None:
         """Gracefully disconnect."""
         logger.info("Disconnecting from Telegram…")
@@ -54,31 +78,49 @@ class TelegramService:
     async def update_bio(self, text: str) -> None:
         """Set the user's "About" (bio) field.
 
+        Concurrent calls are sent one at a time and coalesced: when several
+        wait behind an update in flight, only the newest is sent and the older
+        ones return without a round-trip (their text never lands).
+
         Handles:
-        - FloodWaitError  → waits the required time then retries once.
+        - FloodWaitError  → waits the required time and retries, at most
+          ``_FLOOD_WAIT_ATTEMPTS`` tries; waits over
+          ``_FLOOD_WAIT_MAX_SECONDS`` are re-raised instead of slept out.
         - RPCError        → logs and re-raises.
         """
-        try:
-            await self._client(
-                functions.account.UpdateProfileRequest(about=text)
-            )
-            logger.info("Bio updated → '%s'", text)
-
-        except errors.FloodWaitError as exc:
-            wait = exc.seconds
-            logger.warning(
-                "FloodWaitError: Telegram asks to wait %d s. Sleeping…", wait
-            )
-            await asyncio.sleep(wait)
-            # One retry after the cooldown
-            await self._client(
-                functions.account.UpdateProfileRequest(about=text)
-            )
-            logger.info("Bio updated after flood-wait → '%s'", text)
-
-        except errors.RPCError as exc:
-            logger.error("Telegram RPC error while updating bio: %s", exc)
-            raise
+        self._bio_ticket += 1
+        ticket = self._bio_ticket
+        async with self._bio_lock:
+            if ticket != self._bio_ticket:
+                logger.info("Bio update '%s' superseded by a newer one", text)
+                return
+            await self._send_bio(text)
+
+    async def _send_bio(self, text: str) -> None:
+        for attempt in range(1, _FLOOD_WAIT_ATTEMPTS + 1):
+            try:
+                await self._client(
+                    functions.account.UpdateProfileRequest(about=text)
+                )
+            except errors.FloodWaitError as exc:
+                wait = exc.seconds
+                if attempt == _FLOOD_WAIT_ATTEMPTS or wait > _FLOOD_WAIT_MAX_SECONDS:
+                    logger.error(
+                        "FloodWaitError: Telegram asks to wait %d s "
+                        "(attempt %d/%d) — giving up on this bio update",
+                        wait, attempt, _FLOOD_WAIT_ATTEMPTS,
+                    )
+                    raise
+                logger.warning(
+                    "FloodWaitError: Telegram asks to wait %d s. Sleeping…", wait
+                )
+                await asyncio.sleep(wait)
+            except errors.RPCError as exc:
+                logger.error("Telegram RPC error while updating bio: %s", exc)
+                raise
+            else:
+                logger.info("Bio updated → '%s'", text)
+                return
 
     # ------------------------------------------------------------------
     # Context collection
@@ -227,6 +269,17 @@ class TelegramService:
         await self.stop()
 
 
+def _warn_if_no_cryptg() -> None:
+    """Telethon silently falls back to pure-Python AES without cryptg."""
+    try:
+        import cryptg  # noqa: F401
+    except ImportError:
+        logger.warning(
+            "cryptg is not installed — MTProto encryption will use the slow "
+            "pure-Python AES fallback"
+        )
+
+
 def _message_peer_id(message: Message) -> int | None:
     peer = getattr(message, "peer_id", None)
     if peer is None:
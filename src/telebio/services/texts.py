@@ -7,8 +7,14 @@ Functions take plain values (not ``BotService``) to stay import-light.
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING
+
 from telebio.modes import MODE_DESCRIPTIONS, MODE_LABELS, MODES, display
 
+if TYPE_CHECKING:
+    from telebio.services.bot import HistoryEntry
+
 # ── Shared fragments ──────────────────────────────────────────────────
 
 
@@ -33,34 +39,42 @@ def menu_text(*, mode: str, bio: str, prompt_name: str | None) -> str:
 # ── Status ────────────────────────────────────────────────────────────
 
 
+_STATUS_TMPL = (
+    "🤖 <b>TeleBio Status</b>\n"
+    "\n"
+    "📊 <b>Mode:</b> {mode}\n"
+    "⏯ <b>State:</b> {state}\n"
+    "📝 <b>Current bio:</b> {bio}{tail}"
+)
+_STATUS_LAST_UPDATE = "\n🕐 <b>Last update:</b> "
+
+
+# State only changes on a bio update / toggle, so repeated /status polls
+# between updates reuse the last rendered message.
+@functools.lru_cache(maxsize=1)
 def status_text(*, mode: str, paused: bool, bio: str, last_update: str | None) -> str:
-    lines = [
-        "🤖 <b>TeleBio Status</b>",
-        "",
-        f"📊 <b>Mode:</b> {display(mode)}",
-        f"⏯ <b>State:</b> {pause_state(paused)}",
-        f"📝 <b>Current bio:</b> {bio or '(none)'}",
-    ]
-    if last_update:
-        lines.append(f"🕐 <b>Last update:</b> {last_update}")
-    return "\n".join(lines)
+    return _STATUS_TMPL.format(
+        mode=display(mode),
+        state=pause_state(paused),
+        bio=bio or "(none)",
+        tail=_STATUS_LAST_UPDATE + last_update if last_update else "",
+    )
 
 
 # ── History ───────────────────────────────────────────────────────────
 
 HISTORY_EMPTY = "📜 No history available yet."
+_HISTORY_HEADER = "📜 <b>Recent Bio Updates:</b>\n\n\n\n"
 
 
-def history_text(history: list[dict]) -> str:
+def history_text(history: list[HistoryEntry]) -> str:
+    """Render *history* (newest first) as the /history reply."""
     if not history:
         return HISTORY_EMPTY
-    lines = ["📜 <b>Recent Bio Updates:</b>", ""]
-    for i, entry in enumerate(reversed(history), 1):
-        lines.append(
-            f"{i}. [{entry['timestamp']}] <code>{entry['mode']}</code>\n"
-            f"   {entry['bio']}"
-        )
-    return "\n\n".join(lines)
+    return _HISTORY_HEADER + "\n\n".join(
+        f"{i}. [{entry.timestamp}] <code>{entry.mode}</code>\n   {entry.bio}"
+        for i, entry in enumerate(history, 1)
+    )
 
 
 # ── Pause toggle ──────────────────────────────────────────────────────
@@ -112,6 +126,7 @@ def prompt_view(name: str, system: str) -> str:
 
 NEW_NOT_CONFIGURED = "❌ Bot не настроен для обновления био."
 NEW_ERROR = "❌ Ошибка при обновлении био. Проверьте логи."
+NEW_IN_PROGRESS = "⏳ Новое био уже генерируется, подожди немного."
 
 
 def new_success(bio: str) -> str:
@@ -154,6 +169,8 @@ TOAST_COLLECTING = "Собираю…"
 # ── Onboarding (/start) ───────────────────────────────────────────────
 
 
+# Built from static mode tables only, so render it once.
+@functools.cache
 def onboarding_text() -> str:
     lines = [
         "👋 Привет! Это <b>TeleBio</b> — он сам меняет твоё Telegram bio.",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import AsyncIterator
@@ -14,12 +15,23 @@ import pytest
 # Temporary phrase / example files
 # ------------------------------------------------------------------
 
+_PHRASES = ["Фраза раз", "Фраза два", "Фраза три"]
+_EXAMPLES = ["Борщ — это UI-фреймворк", "Кот одобрил мой коммит"]
+
+
 @pytest.fixture()
 def phrases_file(tmp_path: Path) -> Path:
     """Create a temporary phrases.json with a few entries."""
-    phrases = ["Фраза раз", "Фраза два", "Фраза три"]
     p = tmp_path / "phrases.json"
-    p.write_text(json.dumps(phrases, ensure_ascii=False), encoding="utf-8")
+    p.write_text(json.dumps(_PHRASES, ensure_ascii=False), encoding="utf-8")
+    return p
+
+
+@pytest.fixture(scope="session")
+def shared_phrases_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only phrases.json written once per run (same content as phrases_file)."""
+    p = tmp_path_factory.mktemp("shared") / "phrases.json"
+    p.write_text(json.dumps(_PHRASES, ensure_ascii=False), encoding="utf-8")
     return p
 
 
@@ -59,9 +71,16 @@ def invalid_json_file(tmp_path: Path) -> Path:
 @pytest.fixture()
 def examples_file(tmp_path: Path) -> Path:
     """Create a temporary examples.json for LLM few-shot."""
-    examples = ["Борщ — это UI-фреймворк", "Кот одобрил мой коммит"]
     p = tmp_path / "examples.json"
-    p.write_text(json.dumps(examples, ensure_ascii=False), encoding="utf-8")
+    p.write_text(json.dumps(_EXAMPLES, ensure_ascii=False), encoding="utf-8")
+    return p
+
+
+@pytest.fixture(scope="session")
+def shared_examples_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only examples.json written once per run (same content as examples_file)."""
+    p = tmp_path_factory.mktemp("shared") / "examples.json"
+    p.write_text(json.dumps(_EXAMPLES, ensure_ascii=False), encoding="utf-8")
     return p
 
 
@@ -81,3 +100,63 @@ def mock_telegram() -> AsyncMock:
     tg = AsyncMock()
     tg.update_bio = AsyncMock()
     return tg
+
+
+# ------------------------------------------------------------------
+# Read-only broken / minimal JSON files, written once per run
+# ------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def mixed_types_json(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """JSON array mixing numbers and strings."""
+    p = tmp_path_factory.mktemp("bio") / "mixed.json"
+    p.write_text('[1, "ok"]', encoding="utf-8")
+    return p
+
+
+@pytest.fixture(scope="session")
+def bad_examples_json(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """examples.json holding an object instead of an array."""
+    p = tmp_path_factory.mktemp("bio") / "bad.json"
+    p.write_text('{"not": "array"}', encoding="utf-8")
+    return p
+
+
+@pytest.fixture(scope="session")
+def settings_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project root with one-entry phrases.json and examples.json."""
+    root = tmp_path_factory.mktemp("project")
+    (root / "phrases.json").write_text('["Test phrase"]', encoding="utf-8")
+    (root / "examples.json").write_text('["Example"]', encoding="utf-8")
+    return root
+
+
+# ------------------------------------------------------------------
+# Event loop
+# ------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop, like main() does in production."""
+    try:
+        import uvloop
+    except ImportError:  # e.g. on Windows: keep pytest-asyncio's default loop
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
+
+
+# ------------------------------------------------------------------
+# No real bot client
+# ------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def bot_client_cls(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Make BotService build a MagicMock instead of a real TelegramClient.
+
+    A real client opens a ``bot_session.session`` SQLite file in the working
+    directory on every construction; tests never talk to Telegram anyway.
+    The returned stand-in for the class records how it was called.
+    """
+    cls = MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+    monkeypatch.setattr("telebio.services.bot.TelegramClient", cls)
+    return cls
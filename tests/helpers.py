@@ -0,0 +1,52 @@
+"""Event-loop helpers shared by the async test modules."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from unittest.mock import DEFAULT, AsyncMock
+
+
+async def tick(n: int = 20) -> None:
+    """Let background tasks run for *n* loop iterations, without wall-clock sleeps.
+
+    With ``interval_minutes=0`` (or a bot wake-up) every scheduler cycle only
+    yields to the loop, so a fixed number of ticks is deterministic.
+    """
+    for _ in range(n):
+        await asyncio.sleep(0)
+
+
+def signal_after(mock: AsyncMock, n: int = 1) -> asyncio.Event:
+    """Return an Event that is set once *mock* has been awaited *n* times.
+
+    Wait on it instead of sleeping. The mock keeps its return_value and any
+    side_effect it already had: an exception, a (sync or async) callable, or
+    a sequence of values and exceptions.
+    """
+    event = asyncio.Event()
+    effect = mock.side_effect
+
+    async def side_effect(*args: object, **kwargs: object) -> object:
+        if mock.await_count >= n:
+            event.set()
+        if effect is None:
+            return DEFAULT
+        if isinstance(effect, BaseException) or (
+            isinstance(effect, type) and issubclass(effect, BaseException)
+        ):
+            raise effect
+        if callable(effect):
+            result = effect(*args, **kwargs)
+            return await result if inspect.isawaitable(result) else result
+        # AsyncMock has already turned a sequence into an iterator.
+        try:
+            result = next(effect)
+        except StopIteration:
+            raise StopAsyncIteration from None
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    mock.side_effect = side_effect
+    return event
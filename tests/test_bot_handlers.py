@@ -3,19 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from collections import deque
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from telethon.network import ConnectionTcpAbridged
 
+from telebio.modes import ModeRef
+from telebio.scheduler import run_scheduler
 from telebio.services.bot import BotService
+from telebio.services.handlers import dispatch_command
 from telebio.services.handlers.status import handle_status
 from telebio.services.handlers.history import handle_history
 from telebio.services.handlers.set_mode import handle_set_mode
 from telebio.services.handlers.new import handle_new
 from telebio.services.handlers.pause import handle_pause
 from telebio.context_exceptions import ContextBatchNotReady
+from tests.helpers import signal_after, tick
 
 
 # ------------------------------------------------------------------
@@ -23,32 +29,41 @@ from telebio.context_exceptions import ContextBatchNotReady
 # ------------------------------------------------------------------
 
 
+_FIXED_TIME = 1767268800.0
+_FIXED_TS = "2026-01-01 12:00:00"
+# Fifteen updates: more than the ten-entry history keeps.
+_BIOS = tuple(f"bio {i}" for i in range(15))
+
+
 def _make_bot(**overrides) -> BotService:
     """Build a BotService with sensible defaults (no real Telegram client)."""
     kwargs = dict(
         bot_token="tok",
         api_id=1,
         api_hash="hash",
-        current_mode={"mode": "list"},
+        mode_ref=ModeRef("list"),
     )
     kwargs.update(overrides)
-    bot = BotService(**kwargs)
-    # Replace the real TelegramClient so nothing touches the network
-    bot._bot = MagicMock()
-    return bot
+    return BotService(**kwargs)
 
 
-def _make_event(pattern_match_group: str | None = None) -> AsyncMock:
-    """Create a mock Telethon NewMessage event."""
-    event = AsyncMock()
+def _make_event(pattern_match_group: str | None = None) -> MagicMock:
+    """Create a mock Telethon NewMessage event (only ``respond`` is awaited)."""
+    event = MagicMock()
     event.respond = AsyncMock()
     if pattern_match_group is not None:
-        match = MagicMock()
-        match.group.return_value = pattern_match_group
-        event.pattern_match = match
+        event.pattern_match = _pattern_match(pattern_match_group)
     return event
 
 
+@functools.cache
+def _pattern_match(group: str) -> MagicMock:
+    """Match stub whose ``group()`` returns *group*; handlers only read it, so reuse."""
+    match = MagicMock()
+    match.group.return_value = group
+    return match
+
+
 # ------------------------------------------------------------------
 # /status
 # ------------------------------------------------------------------
@@ -57,7 +72,7 @@ def _make_event(pattern_match_group: str | None = None) -> AsyncMock:
 class TestHandleStatus:
 
     async def test_status_shows_mode_and_state(self) -> None:
-        bot = _make_bot(current_mode={"mode": "llm_prompt_generation"})
+        bot = _make_bot(mode_ref=ModeRef("llm_prompt_generation"))
         event = _make_event()
 
         await handle_status(event, bot)
@@ -127,6 +142,7 @@ class TestHandleHistory:
         assert "second" in text
         assert "list" in text
         assert "llm_prompt_generation" in text
+        assert text.index("1. ") < text.index("second") < text.index("2. ") < text.index("first")
 
 
 # ------------------------------------------------------------------
@@ -136,42 +152,104 @@ class TestHandleHistory:
 
 class TestHandleSetMode:
 
-    async def test_set_mode_switches(self) -> None:
-        bot = _make_bot(current_mode={"mode": "list"})
-        event = _make_event(pattern_match_group="llm_prompt_generation")
+    @pytest.mark.parametrize(
+        ("arg", "expected_mode", "expected_text"),
+        [
+            ("llm_prompt_generation", "llm_prompt_generation", "llm_prompt_generation"),
+            ("list", "list", "Уже выбран"),
+            ("unknown", "list", "Неизвестный режим"),
+            ("TELEGRAM_CONTEXT", "telegram_context", "переключён"),
+        ],
+        ids=["switches", "same_mode", "invalid", "case_insensitive"],
+    )
+    async def test_set_mode(self, arg: str, expected_mode: str, expected_text: str) -> None:
+        bot = _make_bot(mode_ref=ModeRef("list"))
+        event = _make_event(pattern_match_group=arg)
 
         await handle_set_mode(event, bot)
 
-        assert bot.current_mode["mode"] == "llm_prompt_generation"
-        text = event.respond.call_args[0][0]
-        assert "llm_prompt_generation" in text
+        assert bot.mode == expected_mode
+        assert expected_text in event.respond.call_args[0][0]
 
-    async def test_set_mode_same_mode(self) -> None:
-        bot = _make_bot(current_mode={"mode": "list"})
-        event = _make_event(pattern_match_group="list")
 
-        await handle_set_mode(event, bot)
-
-        text = event.respond.call_args[0][0]
-        assert "Уже выбран" in text
+class TestDispatchCommand:
 
-    async def test_set_mode_invalid(self) -> None:
+    async def test_routes_exact_command(self) -> None:
         bot = _make_bot()
-        event = _make_event(pattern_match_group="unknown")
+        event = _make_event()
+        event.raw_text = "/status"
 
-        await handle_set_mode(event, bot)
+        await dispatch_command(event, bot)
 
-        text = event.respond.call_args[0][0]
-        assert "Неизвестный режим" in text
-        assert bot.current_mode["mode"] == "list"
+        assert "TeleBio Status" in event.respond.call_args[0][0]
 
-    async def test_set_mode_case_insensitive(self) -> None:
-        bot = _make_bot(current_mode={"mode": "list"})
-        event = _make_event(pattern_match_group="TELEGRAM_CONTEXT")
+    async def test_accepts_bot_username_suffix(self) -> None:
+        event = _make_event()
+        event.raw_text = "/status@telebio_bot"
 
-        await handle_set_mode(event, bot)
+        await dispatch_command(event, _make_bot())
+
+        event.respond.assert_awaited_once()
+
+    async def test_set_mode_argument_reaches_handler(self) -> None:
+        bot = _make_bot(mode_ref=ModeRef("list"))
+        event = _make_event()
+        event.raw_text = "/set_mode telegram_context"
+
+        await dispatch_command(event, bot)
 
-        assert bot.current_mode["mode"] == "telegram_context"
+        assert bot.mode == "telegram_context"
+
+    async def test_set_mode_accepts_bot_username_suffix(self) -> None:
+        bot = _make_bot(mode_ref=ModeRef("list"))
+        event = _make_event()
+        event.raw_text = "/set_mode@telebio_bot telegram_context"
+
+        await dispatch_command(event, bot)
+
+        assert bot.mode == "telegram_context"
+
+    @pytest.mark.parametrize(
+        "text", ["/set_mode telegram_context extra", "/set_mode  telegram_context"]
+    )
+    async def test_set_mode_requires_exactly_one_argument(self, text: str) -> None:
+        bot = _make_bot(mode_ref=ModeRef("list"))
+        event = _make_event()
+        event.raw_text = text
+
+        await dispatch_command(event, bot)
+
+        event.respond.assert_not_awaited()
+        assert bot.mode == "list"
+
+    async def test_start_deep_link_payload_still_replies(self) -> None:
+        event = _make_event()
+        event.raw_text = "/start foo"
+
+        await dispatch_command(event, _make_bot())
+
+        event.respond.assert_awaited_once()
+
+    async def test_trailing_text_after_argumentless_command_is_ignored(self) -> None:
+        event = _make_event()
+        event.raw_text = "/status please"
+
+        await dispatch_command(event, _make_bot())
+
+        assert "TeleBio Status" in event.respond.call_args[0][0]
+
+    @pytest.mark.parametrize(
+        "text", ["/statusx", "/set_mode", "/set_mode list extra", "hello"]
+    )
+    async def test_ignores_non_commands(self, text: str) -> None:
+        bot = _make_bot(mode_ref=ModeRef("list"))
+        event = _make_event()
+        event.raw_text = text
+
+        await dispatch_command(event, bot)
+
+        event.respond.assert_not_awaited()
+        assert bot.mode == "list"
 
 
 # ------------------------------------------------------------------
@@ -215,6 +293,46 @@ class TestHandleNew:
         assert bot.last_bio == "new bio"
         assert len(bot.history) == 1
 
+    async def test_new_closes_provider(self) -> None:
+        mock_tg = AsyncMock()
+        mock_provider = AsyncMock()
+        mock_provider.get_bio.return_value = "bio"
+        mock_provider.aclose = AsyncMock()
+
+        bot = _make_bot(
+            telegram=mock_tg,
+            provider_factory=lambda _mode: mock_provider,
+        )
+
+        await handle_new(_make_event(), bot)
+
+        mock_provider.aclose.assert_awaited_once()
+
+    async def test_concurrent_new_generates_once(self) -> None:
+        release = asyncio.Event()
+
+        async def _slow_bio() -> str:
+            await release.wait()
+            return "bio"
+
+        mock_provider = AsyncMock()
+        mock_provider.get_bio.side_effect = _slow_bio
+        bot = _make_bot(
+            telegram=AsyncMock(),
+            provider_factory=lambda _mode: mock_provider,
+        )
+        first, second = _make_event(), _make_event()
+
+        task = asyncio.create_task(handle_new(first, bot))
+        await asyncio.sleep(0)
+        await handle_new(second, bot)
+        release.set()
+        await task
+
+        assert "уже генерируется" in second.respond.call_args[0][0]
+        assert "Био обновлено" in first.respond.call_args[0][0]
+        mock_provider.get_bio.assert_awaited_once()
+
     async def test_new_without_telegram(self) -> None:
         bot = _make_bot()  # no telegram, no provider_factory
         event = _make_event()
@@ -249,7 +367,7 @@ class TestHandleNew:
             return p
 
         bot = _make_bot(
-            current_mode={"mode": "telegram_context"},
+            mode_ref=ModeRef("telegram_context"),
             telegram=mock_tg,
             provider_factory=factory,
         )
@@ -273,7 +391,7 @@ class TestHandleNew:
             return p
 
         bot = _make_bot(
-            current_mode={"mode": "llm_prompt_generation"},
+            mode_ref=ModeRef("llm_prompt_generation"),
             telegram=mock_tg,
             provider_factory=factory,
         )
@@ -291,27 +409,21 @@ class TestHandleNew:
 
 class TestHandlePause:
 
-    async def test_pause_toggles_on(self) -> None:
-        bot = _make_bot()
-        assert not bot.paused
-        event = _make_event()
-
-        await handle_pause(event, bot)
-
-        assert bot.paused
-        text = event.respond.call_args[0][0]
-        assert "приостановлено" in text
-
-    async def test_pause_toggles_off(self) -> None:
+    @pytest.mark.parametrize(
+        ("initially_paused", "expected_text"),
+        [(False, "приостановлено"), (True, "возобновлено")],
+        ids=["on", "off"],
+    )
+    async def test_pause_toggles(self, initially_paused: bool, expected_text: str) -> None:
         bot = _make_bot()
-        bot.toggle_pause()  # pause
+        if initially_paused:
+            bot.toggle_pause()
         event = _make_event()
 
         await handle_pause(event, bot)
 
-        assert not bot.paused
-        text = event.respond.call_args[0][0]
-        assert "возобновлено" in text
+        assert bot.paused is not initially_paused
+        assert expected_text in event.respond.call_args[0][0]
 
     async def test_pause_double_toggle(self) -> None:
         bot = _make_bot()
@@ -338,8 +450,28 @@ class TestBotServiceUnit:
         assert bot.last_bio == "test bio"
         assert bot.last_update is not None
         assert len(bot.history) == 1
-        assert bot.history[0]["bio"] == "test bio"
-        assert bot.history[0]["mode"] == "list"
+        assert bot.history[0].bio == "test bio"
+        assert bot.history[0].mode == "list"
+
+    def test_history_max_len(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Only the ring buffer matters here: pin the clock and its formatting.
+        clock = MagicMock()
+        clock.time.return_value = _FIXED_TIME
+        clock.strftime.return_value = _FIXED_TS
+        monkeypatch.setattr("telebio.services.bot.time", clock)
+        bot = _make_bot()
+
+        for bio in _BIOS:
+            bot.record_bio_update(bio, "list")
+
+        assert len(bot.history) == 10
+        assert bot.history[0].bio == "bio 14"
+        assert bot.history[-1].bio == "bio 5"
+        assert bot.history[0].timestamp == _FIXED_TS
+
+    def test_uses_abridged_transport(self, bot_client_cls: MagicMock) -> None:
+        _make_bot()
+        assert bot_client_cls.call_args.kwargs["connection"] is ConnectionTcpAbridged
 
     def test_toggle_pause(self) -> None:
         bot = _make_bot()
@@ -353,11 +485,11 @@ class TestBotServiceUnit:
         mock_tg = AsyncMock()
         factory = lambda m: AsyncMock()
         bot = _make_bot(
-            current_mode={"mode": "llm_prompt_generation"},
+            mode_ref=ModeRef("llm_prompt_generation"),
             telegram=mock_tg,
             provider_factory=factory,
         )
-        assert bot.current_mode == {"mode": "llm_prompt_generation"}
+        assert bot.mode == "llm_prompt_generation"
         assert bot.telegram is mock_tg
         assert bot.provider_factory is factory
         assert bot.last_bio == ""
@@ -374,8 +506,6 @@ class TestSchedulerPause:
 
     async def test_scheduler_skips_when_paused(self, mock_telegram: AsyncMock) -> None:
         """When bot.paused is True the scheduler should NOT call the provider."""
-        from telebio.scheduler import run_scheduler
-
         provider = AsyncMock()
         provider.get_bio.return_value = "bio"
         bot = _make_bot()
@@ -390,7 +520,7 @@ class TestSchedulerPause:
             )
         )
 
-        await asyncio.sleep(0.1)
+        await tick()
         task.cancel()
         with pytest.raises(asyncio.CancelledError):
             await task
@@ -398,9 +528,9 @@ class TestSchedulerPause:
         provider.get_bio.assert_not_awaited()
         mock_telegram.update_bio.assert_not_awaited()
 
-    async def test_scheduler_resumes_after_unpause(self, mock_telegram: AsyncMock) -> None:
-        from telebio.scheduler import run_scheduler
-
+    async def test_scheduler_resumes_after_unpause(
+        self, mock_telegram: AsyncMock
+    ) -> None:
         provider = AsyncMock()
         provider.get_bio.return_value = "bio"
         bot = _make_bot()
@@ -416,15 +546,43 @@ class TestSchedulerPause:
         )
 
         # Let the scheduler notice it's paused
-        await asyncio.sleep(0.05)
+        await tick()
         assert provider.get_bio.await_count == 0
 
-        # Unpause and let it run
+        # Unpause and wait for the first bio to be applied
+        applied = signal_after(mock_telegram.update_bio)
         bot.toggle_pause()
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(applied.wait(), 1)
         task.cancel()
         with pytest.raises(asyncio.CancelledError):
             await task
 
         assert provider.get_bio.await_count >= 1
         mock_telegram.update_bio.assert_awaited()
+
+    async def test_unpause_wakes_scheduler_before_interval(
+        self, mock_telegram: AsyncMock
+    ) -> None:
+        provider = AsyncMock()
+        provider.get_bio.return_value = "bio"
+        bot = _make_bot()
+        bot.toggle_pause()
+
+        task = asyncio.create_task(
+            run_scheduler(
+                mock_telegram,
+                provider,
+                interval_minutes=60,
+                bot=bot,
+            )
+        )
+
+        await tick()
+        applied = signal_after(mock_telegram.update_bio)
+        bot.toggle_pause()
+        await asyncio.wait_for(applied.wait(), 1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        provider.get_bio.assert_awaited_once()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from unittest.mock import AsyncMock, MagicMock
 
+from telebio.modes import ModeRef
 from telebio.prompts import Prompt, get_prompt, load_prompts
 from telebio.services import keyboards
 from telebio.services.bot import BotService
@@ -25,17 +26,15 @@ def _make_bot(mode: str = "list", **overrides) -> BotService:
         bot_token="tok",
         api_id=1,
         api_hash="hash",
-        current_mode={"mode": mode, "prompt_name": "Линал"},
+        mode_ref=ModeRef(mode, "Линал"),
         prompts=_PROMPTS,
     )
     kwargs.update(overrides)
-    bot = BotService(**kwargs)
-    bot._bot = MagicMock()
-    return bot
+    return BotService(**kwargs)
 
 
-def _cb_event(data: str) -> AsyncMock:
-    event = AsyncMock()
+def _cb_event(data: str) -> MagicMock:
+    event = MagicMock()
     event.data = data.encode("utf-8")
     event.sender_id = 1
     event.answer = AsyncMock()
@@ -147,7 +146,7 @@ class TestCallbacks:
 
         await handle_callback(event, bot)
 
-        assert bot.current_mode["mode"] == "telegram_context"
+        assert bot.mode == "telegram_context"
         event.edit.assert_awaited()
         assert "act:collect" in _datas(event.edit.call_args.kwargs["buttons"])
 
@@ -157,7 +156,7 @@ class TestCallbacks:
 
         await handle_callback(event, bot)
 
-        assert bot.current_mode["mode"] == "llm_prompt_generation"
+        assert bot.mode == "llm_prompt_generation"
         assert "pset:0" in _datas(event.edit.call_args.kwargs["buttons"])
 
     async def test_pset_selects_prompt(self) -> None:
@@ -8,31 +8,52 @@ from unittest.mock import patch
 
 import pytest
 
-from telebio.config import Settings, _get_env, load_settings
+from telebio.config import Settings, _get_env, _load_env_once, load_settings
+
+
+_ENV_PREFIXES = ("TELEGRAM_", "YANDEX_", "LLM_", "BIO_")
+_ENV_NAMES = frozenset({
+    "BOT_TOKEN", "SESSION_NAME", "UPDATE_INTERVAL_MINUTES", "LOG_LEVEL",
+    "PHRASES_FILE", "EXAMPLES_FILE", "PROMPTS_FILE",
+    "MY_VAR", "MISSING_VAR", "IMPORTANT_KEY",
+})
+
+
+@pytest.fixture(autouse=True)
+def _no_dotenv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Never read the developer's .env: load_settings() parses it lazily."""
+    monkeypatch.setattr("telebio.config.load_dotenv", lambda *args, **kwargs: None)
+
+
+@pytest.fixture()
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unset every variable config reads; tests setenv what they need."""
+    for name in list(os.environ):
+        if name.startswith(_ENV_PREFIXES) or name in _ENV_NAMES:
+            monkeypatch.delenv(name, raising=False)
 
 
 # ------------------------------------------------------------------
 # _get_env
 # ------------------------------------------------------------------
 
+@pytest.mark.usefixtures("clean_env")
 class TestGetEnv:
 
-    def test_returns_env_value(self) -> None:
-        with patch.dict(os.environ, {"MY_VAR": "hello"}):
-            assert _get_env("MY_VAR") == "hello"
+    def test_returns_env_value(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("MY_VAR", "hello")
+        assert _get_env("MY_VAR") == "hello"
 
     def test_returns_default_when_missing(self) -> None:
-        with patch.dict(os.environ, {}, clear=True):
-            assert _get_env("MISSING_VAR", default="fallback") == "fallback"
+        assert _get_env("MISSING_VAR", default="fallback") == "fallback"
 
     def test_required_raises_when_missing(self) -> None:
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(EnvironmentError, match="IMPORTANT_KEY"):
-                _get_env("IMPORTANT_KEY", required=True)
+        with pytest.raises(EnvironmentError, match="IMPORTANT_KEY"):
+            _get_env("IMPORTANT_KEY", required=True)
 
-    def test_required_does_not_raise_when_present(self) -> None:
-        with patch.dict(os.environ, {"IMPORTANT_KEY": "val"}):
-            assert _get_env("IMPORTANT_KEY", required=True) == "val"
+    def test_required_does_not_raise_when_present(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("IMPORTANT_KEY", "val")
+        assert _get_env("IMPORTANT_KEY", required=True) == "val"
 
 
 # ------------------------------------------------------------------
@@ -70,9 +91,10 @@ class TestSettings:
 # load_settings
 # ------------------------------------------------------------------
 
+@pytest.mark.usefixtures("clean_env")
 class TestLoadSettings:
 
-    def test_loads_from_env(self) -> None:
+    def test_loads_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         env = {
             "TELEGRAM_API_ID": "999",
             "TELEGRAM_API_HASH": "abc123",
@@ -81,8 +103,10 @@ class TestLoadSettings:
             "YANDEX_FOLDER_ID": "folder",
             "YANDEX_TEMPERATURE": "0.5",
         }
-        with patch.dict(os.environ, env, clear=False):
-            s = load_settings()
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        s = load_settings()
 
         assert s.api_id == 999
         assert s.api_hash == "abc123"
@@ -93,6 +117,14 @@ class TestLoadSettings:
         assert s.yandex_temperature == 0.5
 
     def test_raises_without_api_id(self) -> None:
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(EnvironmentError, match="TELEGRAM_API_ID"):
-                load_settings()
+        with pytest.raises(EnvironmentError, match="TELEGRAM_API_ID"):
+            load_settings()
+
+    def test_dotenv_parsed_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        _load_env_once.cache_clear()
+        monkeypatch.setenv("TELEGRAM_API_ID", "1")
+        monkeypatch.setenv("TELEGRAM_API_HASH", "h")
+        with patch("telebio.config.load_dotenv") as mock_load:
+            load_settings()
+            load_settings()
+        mock_load.assert_called_once()
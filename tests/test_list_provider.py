@@ -19,7 +19,7 @@ class TestListBioProviderInit:
 
     def test_loads_phrases_from_valid_file(self, phrases_file: Path) -> None:
         provider = ListBioProvider(phrases_file)
-        assert provider._phrases == ["Фраза раз", "Фраза два", "Фраза три"]
+        assert provider._phrases == ("Фраза раз", "Фраза два", "Фраза три")
 
     def test_raises_on_missing_file(self, tmp_path: Path) -> None:
         with pytest.raises(FileNotFoundError, match="not found"):
@@ -33,16 +33,39 @@ class TestListBioProviderInit:
         with pytest.raises(ValueError, match="empty"):
             ListBioProvider(empty_list_file)
 
+    def test_duplicate_phrases_share_one_object(self, tmp_path: Path) -> None:
+        path = tmp_path / "dups.json"
+        path.write_text('["Повтор", "Другое", "Повтор"]', encoding="utf-8")
+        provider = ListBioProvider(path)
+        assert provider._phrases[0] is provider._phrases[2]
+
+    def test_raises_on_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError, match="JSON array"):
+            ListBioProvider(path)
+
     def test_truncates_long_phrases(self, long_phrases_file: Path) -> None:
         provider = ListBioProvider(long_phrases_file)
         assert provider._phrases[0] == "Короткая"
         assert len(provider._phrases[1]) == 70
 
-    def test_raises_on_mixed_types(self, tmp_path: Path) -> None:
-        p = tmp_path / "bad.json"
-        p.write_text('[1, "ok"]', encoding="utf-8")
+    def test_raises_on_mixed_types(self, mixed_types_json: Path) -> None:
         with pytest.raises(ValueError, match="JSON array of strings"):
-            ListBioProvider(p)
+            ListBioProvider(mixed_types_json)
+
+    def test_rebuild_reuses_parsed_phrases(self, phrases_file: Path) -> None:
+        first = ListBioProvider(phrases_file)
+        second = ListBioProvider(phrases_file)
+        assert second._phrases is first._phrases
+
+    def test_reloads_when_file_changes(self, phrases_file: Path) -> None:
+        ListBioProvider(phrases_file)
+        phrases_file.write_text(
+            json.dumps(["Новая фраза, подлиннее"], ensure_ascii=False), encoding="utf-8"
+        )
+        provider = ListBioProvider(phrases_file)
+        assert provider._phrases == ("Новая фраза, подлиннее",)
 
 
 # ------------------------------------------------------------------
@@ -53,8 +76,9 @@ class TestListBioProviderGetBio:
     """Tests for the get_bio method (sequential with wrap-around)."""
 
     @pytest.fixture()
-    def provider(self, phrases_file: Path) -> ListBioProvider:
-        return ListBioProvider(phrases_file)
+    def provider(self, shared_phrases_file: Path) -> ListBioProvider:
+        # The file is parsed once per run; each test still gets a fresh cursor.
+        return ListBioProvider(shared_phrases_file)
 
     async def test_returns_first_phrase(self, provider: ListBioProvider) -> None:
         assert await provider.get_bio() == "Фраза раз"
@@ -9,7 +9,6 @@ from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
-import respx
 
 from telebio.providers.llm_provider import (
     LLMBioProvider,
@@ -36,10 +35,20 @@ def _make_yandex_response(text: str) -> dict[str, Any]:
     }
 
 
+# Built once at import. _extract_text only reads its argument, so tests share
+# these; deepcopy one before mutating it.
+_RESP_PADDED = _make_yandex_response("  Кот на Луне  ")
+_RESP_LONG = _make_yandex_response("Б" * 100)
+# Wire bodies for the mock transport.
+_BODY_OK = json.dumps(_make_yandex_response("ok")).encode()
+_BODY_GENERATED = json.dumps(_make_yandex_response("Сгенерированное био")).encode()
+
+
 def _make_provider(
     examples_path: Path,
     api_key: str = "test-key",
     folder_id: str = "test-folder",
+    transport: httpx.AsyncBaseTransport | None = None,
 ) -> LLMBioProvider:
     return LLMBioProvider(
         api_key=api_key,
@@ -47,9 +56,32 @@ def _make_provider(
         examples_path=examples_path,
         model="yandexgpt-lite/latest",
         temperature=0.8,
+        transport=transport,
     )
 
 
+_Recorded = tuple[httpx.MockTransport, list[httpx.Request]]
+
+
+def _mock_transport(content: bytes, status_code: int = 200) -> _Recorded:
+    """In-memory transport that answers every request the same way.
+
+    Returns the transport and the list it appends each received request to.
+    """
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, content=content)
+
+    return httpx.MockTransport(handler), requests
+
+
+def _sent_body(provider: LLMBioProvider) -> dict[str, Any]:
+    """Decode the pre-serialised request payload."""
+    return json.loads(provider._payload)
+
+
 # ------------------------------------------------------------------
 # Construction
 # ------------------------------------------------------------------
@@ -58,17 +90,22 @@ class TestLLMBioProviderInit:
 
     def test_loads_examples(self, examples_file: Path) -> None:
         provider = _make_provider(examples_file)
-        assert len(provider._examples) == 2
+        msgs = _sent_body(provider)["messages"]
+        examples = [m["text"] for m in msgs if m["role"] == "assistant"]
+        assert examples == ["Борщ — это UI-фреймворк", "Кот одобрил мой коммит"]
 
     def test_missing_examples_file_yields_empty(self, missing_examples_path: Path) -> None:
         provider = _make_provider(missing_examples_path)
-        assert provider._examples == []
+        roles = [m["role"] for m in _sent_body(provider)["messages"]]
+        assert "assistant" not in roles
+
+    def test_examples_not_kept_after_init(self, examples_file: Path) -> None:
+        provider = _make_provider(examples_file)
+        assert not hasattr(provider, "_examples")
 
-    def test_invalid_examples_raises(self, tmp_path: Path) -> None:
-        p = tmp_path / "bad.json"
-        p.write_text('{"not": "array"}', encoding="utf-8")
+    def test_invalid_examples_raises(self, bad_examples_json: Path) -> None:
         with pytest.raises(ValueError, match="JSON array of strings"):
-            _make_provider(p)
+            _make_provider(bad_examples_json)
 
     def test_model_uri_constructed_correctly(self, examples_file: Path) -> None:
         provider = _make_provider(examples_file, folder_id="abc123")
@@ -76,19 +113,21 @@ class TestLLMBioProviderInit:
 
 
 # ------------------------------------------------------------------
-# _build_request_body
+# Request payload
 # ------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def body(shared_examples_file: Path) -> dict[str, Any]:
+    """The payload is immutable after init, so build and decode it once."""
+    return _sent_body(_make_provider(shared_examples_file))
+
+
 class TestBuildRequestBody:
 
-    def test_contains_system_prompt(self, examples_file: Path) -> None:
-        provider = _make_provider(examples_file)
-        body = provider._build_request_body()
+    def test_contains_system_prompt(self, body: dict[str, Any]) -> None:
         assert body["messages"][0] == {"role": "system", "text": _SYSTEM_PROMPT}
 
-    def test_few_shot_pairs(self, examples_file: Path) -> None:
-        provider = _make_provider(examples_file)
-        body = provider._build_request_body()
+    def test_few_shot_pairs(self, body: dict[str, Any]) -> None:
         msgs = body["messages"]
         # system + 2*(user+assistant) + final user = 1 + 4 + 1 = 6
         assert len(msgs) == 6
@@ -98,15 +137,13 @@ class TestBuildRequestBody:
 
     def test_no_examples_still_has_system_and_user(self, missing_examples_path: Path) -> None:
         provider = _make_provider(missing_examples_path)
-        body = provider._build_request_body()
+        body = _sent_body(provider)
         msgs = body["messages"]
         assert len(msgs) == 2  # system + user
         assert msgs[0]["role"] == "system"
         assert msgs[1]["role"] == "user"
 
-    def test_completion_options(self, examples_file: Path) -> None:
-        provider = _make_provider(examples_file)
-        body = provider._build_request_body()
+    def test_completion_options(self, body: dict[str, Any]) -> None:
         opts = body["completionOptions"]
         assert opts["stream"] is False
         assert opts["temperature"] == 0.8
@@ -120,13 +157,10 @@ class TestBuildRequestBody:
 class TestExtractText:
 
     def test_extracts_text(self) -> None:
-        data = _make_yandex_response("  Кот на Луне  ")
-        assert LLMBioProvider._extract_text(data) == "Кот на Луне"
+        assert LLMBioProvider._extract_text(_RESP_PADDED) == "Кот на Луне"
 
     def test_truncates_long_text(self) -> None:
-        long = "Б" * 100
-        data = _make_yandex_response(long)
-        result = LLMBioProvider._extract_text(data)
+        result = LLMBioProvider._extract_text(_RESP_LONG)
         assert len(result) == _TELEGRAM_BIO_MAX_LENGTH
 
     def test_raises_on_bad_structure_missing_result(self) -> None:
@@ -142,37 +176,76 @@ class TestExtractText:
 # get_bio (integration with mocked HTTP)
 # ------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def ok_transport() -> _Recorded:
+    """Transport replying ``"ok"``, shared by the tests of one class."""
+    return _mock_transport(_BODY_OK)
+
+
 class TestGetBio:
 
-    @respx.mock
     async def test_successful_generation(self, examples_file: Path) -> None:
-        provider = _make_provider(examples_file)
-        respx.post(_YANDEX_API_URL).mock(
-            return_value=httpx.Response(200, json=_make_yandex_response("Сгенерированное био"))
-        )
+        transport, _ = _mock_transport(_BODY_GENERATED)
+        provider = _make_provider(examples_file, transport=transport)
 
         result = await provider.get_bio()
         assert result == "Сгенерированное био"
 
-    @respx.mock
-    async def test_sends_correct_headers(self, examples_file: Path) -> None:
-        provider = _make_provider(examples_file, api_key="my-key", folder_id="my-folder")
-        route = respx.post(_YANDEX_API_URL).mock(
-            return_value=httpx.Response(200, json=_make_yandex_response("ok"))
+    async def test_sends_correct_headers(
+        self, examples_file: Path, ok_transport: _Recorded
+    ) -> None:
+        transport, requests = ok_transport
+        provider = _make_provider(
+            examples_file, api_key="my-key", folder_id="my-folder", transport=transport
         )
 
         await provider.get_bio()
 
-        request = route.calls.last.request
+        request = requests[-1]
+        assert request.method == "POST"
+        assert request.url == _YANDEX_API_URL
         assert request.headers["Authorization"] == "Api-Key my-key"
         assert request.headers["x-folder-id"] == "my-folder"
 
-    @respx.mock
+    async def test_sends_precomputed_body(
+        self, examples_file: Path, ok_transport: _Recorded
+    ) -> None:
+        transport, requests = ok_transport
+        provider = _make_provider(examples_file, transport=transport)
+
+        await provider.get_bio()
+
+        request = requests[-1]
+        assert request.headers["content-type"] == "application/json"
+        assert request.content == provider._payload
+
     async def test_http_error_propagates(self, examples_file: Path) -> None:
-        provider = _make_provider(examples_file)
-        respx.post(_YANDEX_API_URL).mock(
-            return_value=httpx.Response(500, text="Internal Server Error")
-        )
+        transport, _ = _mock_transport(b"Internal Server Error", status_code=500)
+        provider = _make_provider(examples_file, transport=transport)
 
         with pytest.raises(httpx.HTTPStatusError):
             await provider.get_bio()
+
+    async def test_reuses_http_client_between_calls(
+        self, examples_file: Path, ok_transport: _Recorded
+    ) -> None:
+        provider = _make_provider(examples_file, transport=ok_transport[0])
+
+        await provider.get_bio()
+        client = provider._client
+        await provider.get_bio()
+
+        assert client is not None
+        assert provider._client is client
+
+    async def test_aclose_releases_client(
+        self, examples_file: Path, ok_transport: _Recorded
+    ) -> None:
+        provider = _make_provider(examples_file, transport=ok_transport[0])
+        await provider.get_bio()
+        client = provider._client
+
+        await provider.aclose()
+
+        assert client.is_closed
+        assert provider._client is None
@@ -1,30 +1,30 @@
-"""Tests for the provider factory in main.py."""
+"""Tests for the provider factory and shutdown wait in main.py."""
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from main import _build_provider
+from main import _build_provider, _wait_for_shutdown
 from telebio.config import Settings
 from telebio.providers.list_provider import ListBioProvider
 from telebio.providers.llm_provider import LLMBioProvider
 
 
-@pytest.fixture()
-def base_settings(tmp_path: Path) -> Settings:
-    """Settings pointing at real temp files for the list provider."""
-    phrases = tmp_path / "phrases.json"
-    phrases.write_text('["Test phrase"]', encoding="utf-8")
-    examples = tmp_path / "examples.json"
-    examples.write_text('["Example"]', encoding="utf-8")
+@pytest.fixture(scope="class")
+def base_settings(settings_root: Path) -> Settings:
+    """Settings pointing at real temp files for the list provider.
+
+    Settings is frozen and tests only ``replace`` it, so one per class is enough.
+    """
     return Settings(
         api_id=1,
         api_hash="h",
-        project_root=tmp_path,
+        project_root=settings_root,
         phrases_file="phrases.json",
         examples_file="examples.json",
         yandex_api_key="key",
@@ -61,3 +61,34 @@ class TestBuildProvider:
         s = replace(base_settings, bio_provider="magic")
         with pytest.raises(ValueError, match="Unknown BIO_PROVIDER"):
             _build_provider(s)
+
+
+class TestWaitForShutdown:
+
+    async def test_stop_event_cancels_scheduler(self) -> None:
+        stop_event = asyncio.Event()
+        scheduler_task = asyncio.create_task(asyncio.sleep(3600))
+        stop_event.set()
+
+        await asyncio.wait_for(_wait_for_shutdown(stop_event, scheduler_task), 1)
+
+        assert scheduler_task.cancelled()
+
+    async def test_scheduler_crash_returns_without_signal(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        async def _crash() -> None:
+            raise RuntimeError("boom")
+
+        stop_event = asyncio.Event()
+        scheduler_task = asyncio.create_task(_crash())
+        tasks_before = asyncio.all_tasks()
+
+        await asyncio.wait_for(_wait_for_shutdown(stop_event, scheduler_task), 1)
+
+        assert not stop_event.is_set()
+        [record] = [r for r in caplog.records if "Scheduler crashed" in r.getMessage()]
+        assert record.levelname == "ERROR"
+        assert isinstance(record.exc_info[1], RuntimeError)
+        # The internal stop-waiter was cancelled and awaited, not leaked.
+        assert asyncio.all_tasks() - tasks_before == set()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import pytest
 
 from telebio.providers.base import BioProvider
 from telebio.providers.list_provider import ListBioProvider
@@ -10,16 +10,12 @@ from telebio.providers.llm_provider import LLMBioProvider
 
 
 class TestProtocolConformance:
-    """Both providers must satisfy the BioProvider protocol."""
+    """Both providers must satisfy the BioProvider protocol.
 
-    def test_list_provider_is_bio_provider(self, phrases_file: Path) -> None:
-        provider = ListBioProvider(phrases_file)
-        assert isinstance(provider, BioProvider)
+    The protocol has only method members, so issubclass checks the class
+    structurally without building a provider.
+    """
 
-    def test_llm_provider_is_bio_provider(self, examples_file: Path) -> None:
-        provider = LLMBioProvider(
-            api_key="k",
-            folder_id="f",
-            examples_path=examples_file,
-        )
-        assert isinstance(provider, BioProvider)
+    @pytest.mark.parametrize("cls", [ListBioProvider, LLMBioProvider])
+    def test_is_bio_provider(self, cls: type) -> None:
+        assert issubclass(cls, BioProvider)
@@ -3,62 +3,94 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
+from telebio.modes import ModeRef
 from telebio.scheduler import run_scheduler
+from tests.helpers import signal_after
 
 
 class TestRunScheduler:
 
-    async def test_calls_provider_and_telegram(self, mock_telegram: AsyncMock) -> None:
-        """Scheduler should get bio from provider and push it to Telegram."""
+    @pytest.mark.parametrize(
+        ("provider_effects", "telegram_effects", "cycles", "final"),
+        [
+            (["test bio"], None, 1, "test bio"),
+            ([RuntimeError("boom"), "ok bio"], None, 2, "ok bio"),
+            (["bio", "bio"], [Exception("network"), None], 2, "bio"),
+        ],
+        ids=["calls_provider_and_telegram", "continues_on_provider_error",
+             "continues_on_telegram_error"],
+    )
+    async def test_update_cycles(
+        self,
+        mock_telegram: AsyncMock,
+        provider_effects: list,
+        telegram_effects: list | None,
+        cycles: int,
+        final: str,
+    ) -> None:
+        """Each cycle pushes the provider's bio; a failing cycle doesn't stop the loop."""
         provider = AsyncMock()
-        provider.get_bio.return_value = "test bio"
+        provider.get_bio.side_effect = provider_effects
+        mock_telegram.update_bio.side_effect = telegram_effects
+        last_cycle = signal_after(provider.get_bio, cycles)
 
-        task = asyncio.create_task(run_scheduler(mock_telegram, provider, interval_minutes=60))
+        task = asyncio.create_task(run_scheduler(mock_telegram, provider, interval_minutes=0))
 
-        # Give the loop one iteration to run
-        await asyncio.sleep(0.05)
+        await asyncio.wait_for(last_cycle.wait(), 1)
         task.cancel()
 
         with pytest.raises(asyncio.CancelledError):
             await task
 
-        provider.get_bio.assert_awaited_once()
-        mock_telegram.update_bio.assert_awaited_once_with("test bio")
+        assert provider.get_bio.await_count == cycles
+        assert mock_telegram.update_bio.await_args == call(final)
 
-    async def test_continues_on_provider_error(self, mock_telegram: AsyncMock) -> None:
-        """If the provider raises, the scheduler should NOT crash."""
+    async def test_closes_provider_on_cancel(
+        self, mock_telegram: AsyncMock
+    ) -> None:
         provider = AsyncMock()
-        provider.get_bio.side_effect = [RuntimeError("boom"), "ok bio"]
-
-        task = asyncio.create_task(run_scheduler(mock_telegram, provider, interval_minutes=0))
+        provider.get_bio.return_value = "bio"
+        provider.aclose = AsyncMock()
+        applied = signal_after(mock_telegram.update_bio)
 
-        # Let two iterations run (both happen almost instantly because interval=0)
-        await asyncio.sleep(0.1)
+        task = asyncio.create_task(run_scheduler(mock_telegram, provider, interval_minutes=60))
+        await asyncio.wait_for(applied.wait(), 1)
         task.cancel()
 
         with pytest.raises(asyncio.CancelledError):
             await task
 
-        assert provider.get_bio.await_count >= 2
-        # The second call should have succeeded
-        mock_telegram.update_bio.assert_awaited_with("ok bio")
-
-    async def test_continues_on_telegram_error(self, mock_telegram: AsyncMock) -> None:
-        """If Telegram service raises, the scheduler should NOT crash."""
-        provider = AsyncMock()
-        provider.get_bio.return_value = "bio"
-        mock_telegram.update_bio.side_effect = [Exception("network"), None]
-
-        task = asyncio.create_task(run_scheduler(mock_telegram, provider, interval_minutes=0))
-
-        await asyncio.sleep(0.1)
+        assert provider.aclose.await_count == 1
+
+    async def test_rebuilds_provider_on_mode_change(
+        self, mock_telegram: AsyncMock
+    ) -> None:
+        initial = AsyncMock()
+        initial.get_bio.return_value = "old"
+        rebuilt = AsyncMock()
+        rebuilt.get_bio.return_value = "new"
+        factory = MagicMock(return_value=rebuilt)
+        mode_ref = ModeRef("list")
+        first_applied = signal_after(mock_telegram.update_bio)
+        rebuilt_used = signal_after(rebuilt.get_bio)
+
+        task = asyncio.create_task(
+            run_scheduler(
+                mock_telegram, initial, interval_minutes=0,
+                provider_factory=factory, mode_ref=mode_ref,
+            )
+        )
+        await asyncio.wait_for(first_applied.wait(), 1)
+        mode_ref.mode = "llm_prompt_generation"
+        await asyncio.wait_for(rebuilt_used.wait(), 1)
         task.cancel()
 
         with pytest.raises(asyncio.CancelledError):
             await task
 
-        assert provider.get_bio.await_count >= 2
+        assert factory.call_args_list == [call("llm_prompt_generation")]
+        assert mock_telegram.update_bio.await_args_list == [call("old"), call("new")]
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from pathlib import Path
 
+from telebio.modes import ModeRef
 from telebio.services.bot import BotService
 from telebio.services.state_store import StateStore
 
@@ -67,6 +68,13 @@ class TestBioHistory:
             store.append_bio(bio=f"bio {i}", mode="list", ts=ts)
         assert len(store.load_history()) == 50
 
+    def test_limit_returns_newest_oldest_first(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        ts = datetime(2026, 1, 1, 0, 0, 0)
+        for i in range(5):
+            store.append_bio(bio=f"bio {i}", mode="list", ts=ts)
+        assert [r["bio"] for r in store.load_history(limit=2)] == ["bio 3", "bio 4"]
+
 
 class TestBotServiceRestore:
 
@@ -75,14 +83,14 @@ class TestBotServiceRestore:
             bot_token="tok",
             api_id=1,
             api_hash="hash",
-            current_mode={"mode": mode},
+            mode_ref=ModeRef(mode),
             store=store,
         )
         return bot
 
     def test_fresh_store_keeps_defaults(self, tmp_path: Path) -> None:
         bot = self._bot(_store(tmp_path), mode="list")
-        assert bot.current_mode["mode"] == "list"
+        assert bot.mode == "list"
         assert bot.paused is False
         assert bot.last_bio == ""
         assert list(bot.history) == []
@@ -95,8 +103,8 @@ class TestBotServiceRestore:
         bot1.toggle_pause()
 
         bot2 = self._bot(StateStore(path), mode="list")
-        assert bot2.current_mode["mode"] == "telegram_context"
-        assert bot2.current_mode["prompt_name"] == "Абсурд"
+        assert bot2.mode == "telegram_context"
+        assert bot2.prompt_name == "Абсурд"
         assert bot2.paused is True
 
     def test_persists_bio_history(self, tmp_path: Path) -> None:
@@ -106,7 +114,31 @@ class TestBotServiceRestore:
         bot1.record_bio_update("bio B", "telegram_context")
 
         bot2 = self._bot(StateStore(path))
-        bios = [row["bio"] for row in bot2.history]
-        assert bios == ["bio A", "bio B"]
+        bios = [row.bio for row in bot2.history]
+        assert bios == ["bio B", "bio A"]
         assert bot2.last_bio == "bio B"
         assert bot2.last_update is not None
+        assert bot2.last_update_str == bot1.last_update_str
+
+    def test_restores_only_recent_history(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        ts = datetime(2026, 1, 1, 12, 0, 0)
+        for i in range(12):
+            store.append_bio(bio=f"bio {i}", mode="list", ts=ts)
+
+        bot = self._bot(store)
+        bios = [row.bio for row in bot.history]
+        assert bios == [f"bio {i}" for i in range(11, 1, -1)]
+        assert bot.history[0].timestamp == "2026-01-01 12:00:00"
+
+    def test_restores_history_timestamp_verbatim(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        store._conn.execute(
+            "INSERT INTO bio_history(ts, bio, mode) VALUES(?, ?, ?)",
+            ("2026-01-01T12:00:00", "iso bio", "list"),
+        )
+
+        bot = self._bot(store)
+        assert [(row.bio, row.timestamp) for row in bot.history] == [
+            ("iso bio", "2026-01-01T12:00:00")
+        ]
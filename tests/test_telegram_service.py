@@ -7,11 +7,28 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from telethon.errors import FloodWaitError, RPCError
+from telethon.network import ConnectionTcpAbridged
 from telethon.tl.types import Message
 
 from telebio.services.telegram import TelegramService
 
 
+# Telethon errors only read the request's class name for their message; an
+# empty spec keeps the mock from growing child mocks.
+_DUMMY_REQUEST = MagicMock(spec=[])
+
+
+def _flood_wait(seconds: int) -> FloodWaitError:
+    exc = FloodWaitError(request=_DUMMY_REQUEST, capture=0)
+    exc.seconds = seconds
+    return exc
+
+
+def _rpc_error() -> RPCError:
+    return RPCError(request=_DUMMY_REQUEST, message="TEST_ERROR")
+
+
 class _AsyncIter:
     def __init__(self, items):
         self._items = list(items)
@@ -60,22 +77,47 @@ def _make_dialog(*, peer_id: int, title: str) -> MagicMock:
 # ------------------------------------------------------------------
 
 @pytest.fixture()
-def mock_client() -> AsyncMock:
-    """A mocked TelegramClient."""
+def mock_client(request: pytest.FixtureRequest) -> AsyncMock:
+    """A mocked TelegramClient.
+
+    Parametrize it indirectly with a zero-argument factory for what awaiting
+    the client (an RPC call) raises or returns. The factory runs per test so
+    a raised exception's traceback never outlives the test that raised it.
+    """
     client = AsyncMock()
     me = MagicMock()
     me.first_name = "TestUser"
     me.id = 12345
     client.get_me.return_value = me
+    factory = getattr(request, "param", None)
+    client.side_effect = factory() if factory is not None else None
     return client
 
 
 @pytest.fixture()
-def service(mock_client: AsyncMock) -> TelegramService:
-    """TelegramService with the internal client mocked."""
-    svc = TelegramService(api_id=1, api_hash="hash", session_path="/tmp/test")
-    svc._client = mock_client
-    return svc
+def service(mock_client: AsyncMock, monkeypatch: pytest.MonkeyPatch) -> TelegramService:
+    """TelegramService built around the mocked client.
+
+    The service itself is cheap and keeps per-test state (me_id, the bio
+    lock, the last applied bio), so it stays function-scoped; only the real
+    TelegramClient, which opens a SQLite session file, is never created.
+    """
+    monkeypatch.setattr(
+        "telebio.services.telegram.TelegramClient", lambda *args, **kwargs: mock_client
+    )
+    return TelegramService(api_id=1, api_hash="hash", session_path="/tmp/test")
+
+
+@pytest.fixture()
+def flood_sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Record FloodWait back-off sleeps instead of waiting them out.
+
+    ``telebio.services.telegram.asyncio`` is the asyncio module itself, so this
+    is only for tests that never await asyncio.sleep themselves.
+    """
+    sleep = AsyncMock()
+    monkeypatch.setattr("telebio.services.telegram.asyncio.sleep", sleep)
+    return sleep
 
 
 # ------------------------------------------------------------------
@@ -84,21 +126,38 @@ def service(mock_client: AsyncMock) -> TelegramService:
 
 class TestLifecycle:
 
-    async def test_start_calls_client_start(self, service: TelegramService, mock_client: AsyncMock) -> None:
+    def test_uses_abridged_transport(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client_cls = MagicMock()
+        monkeypatch.setattr("telebio.services.telegram.TelegramClient", client_cls)
+
+        TelegramService(api_id=1, api_hash="hash", session_path="/tmp/test")
+
+        assert client_cls.call_args.kwargs["connection"] is ConnectionTcpAbridged
+
+    async def test_start_stop_and_context_manager(
+        self, service: TelegramService, mock_client: AsyncMock
+    ) -> None:
         await service.start()
         mock_client.start.assert_awaited_once()
         mock_client.get_me.assert_awaited_once()
+        assert service.me_id == 12345
 
-    async def test_stop_disconnects(self, service: TelegramService, mock_client: AsyncMock) -> None:
         await service.stop()
         mock_client.disconnect.assert_awaited_once()
 
-    async def test_context_manager(self, service: TelegramService, mock_client: AsyncMock) -> None:
+        mock_client.reset_mock()
         async with service:
             pass
         mock_client.start.assert_awaited_once()
         mock_client.disconnect.assert_awaited_once()
 
+    async def test_start_warns_without_cryptg(
+        self, service: TelegramService, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with patch.dict("sys.modules", {"cryptg": None}):
+            await service.start()
+        assert "cryptg is not installed" in caplog.text
+
 
 # ------------------------------------------------------------------
 # update_bio
@@ -110,26 +169,71 @@ class TestUpdateBio:
         await service.update_bio("New bio text")
         mock_client.assert_awaited_once()
 
-    async def test_flood_wait_retry(self, service: TelegramService, mock_client: AsyncMock) -> None:
+    # First call raises FloodWaitError, second call succeeds
+    @pytest.mark.parametrize(
+        "mock_client", [lambda: [_flood_wait(0), None]], indirect=True, ids=["flood_then_ok"]
+    )
+    async def test_flood_wait_retry(
+        self, service: TelegramService, mock_client: AsyncMock, flood_sleep: AsyncMock
+    ) -> None:
         """FloodWaitError should cause a sleep then retry."""
-        from telethon.errors import FloodWaitError
+        await service.update_bio("retry bio")
 
-        # First call raises FloodWaitError, second call succeeds
-        exc = FloodWaitError(request=MagicMock(), capture=0)
-        exc.seconds = 0  # Don't actually sleep in tests
-        mock_client.side_effect = [exc, None]
+        flood_sleep.assert_awaited_once_with(0)
+        assert mock_client.await_count == 2
 
-        with patch("telebio.services.telegram.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            await service.update_bio("retry bio")
-            mock_sleep.assert_awaited_once_with(0)
+    @pytest.mark.parametrize("mock_client", [lambda: _flood_wait(0)], indirect=True, ids=["flood"])
+    async def test_flood_wait_gives_up_after_max_attempts(
+        self, service: TelegramService, mock_client: AsyncMock, flood_sleep: AsyncMock
+    ) -> None:
+        with pytest.raises(FloodWaitError):
+            await service.update_bio("never lands")
 
-        assert mock_client.await_count == 2
+        assert mock_client.await_count == 3
 
-    async def test_rpc_error_reraises(self, service: TelegramService, mock_client: AsyncMock) -> None:
-        from telethon.errors import RPCError
+    @pytest.mark.parametrize(
+        "mock_client", [lambda: _flood_wait(3600)], indirect=True, ids=["long_flood"]
+    )
+    async def test_long_flood_wait_reraises_without_sleeping(
+        self, service: TelegramService, mock_client: AsyncMock, flood_sleep: AsyncMock
+    ) -> None:
+        with pytest.raises(FloodWaitError):
+            await service.update_bio("too soon")
 
-        mock_client.side_effect = RPCError(request=MagicMock(), message="TEST_ERROR")
+        flood_sleep.assert_not_awaited()
+        mock_client.assert_awaited_once()
+
+    async def test_burst_sends_in_flight_and_newest_only(
+        self, service: TelegramService, mock_client: AsyncMock
+    ) -> None:
+        """/new racing the scheduler: waiters superseded by a newer text skip the RPC."""
+        async def _slow_rpc(_request) -> None:
+            await asyncio.sleep(0)  # yield like a real round-trip would
+
+        mock_client.side_effect = _slow_rpc
+        await asyncio.gather(
+            service.update_bio("first"),
+            service.update_bio("second"),
+            service.update_bio("third"),
+        )
+        sent = [c.args[0].about for c in mock_client.await_args_list]
+        assert sent == ["first", "third"]
 
+    async def test_concurrent_different_updates_both_sent(
+        self, service: TelegramService, mock_client: AsyncMock
+    ) -> None:
+        await asyncio.gather(service.update_bio("first"), service.update_bio("second"))
+        assert mock_client.await_count == 2
+
+    async def test_sequential_identical_updates_are_resent(
+        self, service: TelegramService, mock_client: AsyncMock
+    ) -> None:
+        await service.update_bio("same")
+        await service.update_bio("same")
+        assert mock_client.await_count == 2
+
+    @pytest.mark.parametrize("mock_client", [_rpc_error], indirect=True, ids=["rpc_error"])
+    async def test_rpc_error_reraises(self, service: TelegramService, mock_client: AsyncMock) -> None:
         with pytest.raises(RPCError):
             await service.update_bio("will fail")
 